@@ -1,9 +1,35 @@
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from config import API_KEY, CSE_ID, GEMINI_API_KEY
 
+GEMINI_ENDPOINT = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
+# Returned by optimize_resume_with_gemini when the call fails
+GEMINI_ERROR_MESSAGE = "[Error: Could not optimize resume with Gemini AI.]"
+
+# One session for all Gemini calls, so concurrent optimizations reuse pooled TLS connections
+# instead of opening a new one per job. Rate limits and transient server errors are retried
+# with backoff (POST included, since the request has no side effects).
+GEMINI_SESSION = requests.Session()
+GEMINI_SESSION.headers.update({"Content-Type": "application/json"})
+GEMINI_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1, pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=frozenset({"POST"}), raise_on_status=False)
+))
+
+# Static instructions for resume optimization. Prompts are laid out from most to least stable
+# (instructions, then the resume, then the job description) so the shared prefix is identical
+# across every job of a run and can be reused by provider-side prompt caching.
+OPTIMIZATION_PROMPT_PREFIX = (
+    "You are an expert career coach and resume writer. "
+    "Given the following resume and job description, suggest improvements to the resume to better match the job. "
+    "Return the improved resume or a list of specific suggestions.\n"
+)
+
 
 def search_jobs(query, api_key=None, cse_id=None, max_age_hours=None):
     """
@@ -45,24 +71,18 @@ def optimize_resume_with_gemini(resume_text, job_description):
     Returns the optimized resume or suggestions as a string.
     """
     try:
-        endpoint = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
-        headers = {"Content-Type": "application/json"}
-        prompt = (
-            "You are an expert career coach and resume writer. "
-            "Given the following resume and job description, suggest improvements to the resume to better match the job. "
-            "Return the improved resume or a list of specific suggestions.\n"
-            f"Resume:\n{resume_text}\nJob Description:\n{job_description}"
-        )
+        # Job-specific content goes last; everything before it is the same for every job
+        prompt = f"{OPTIMIZATION_PROMPT_PREFIX}Resume:\n{resume_text}\nJob Description:\n{job_description}"
         data = {
             "contents": [{"parts": [{"text": prompt}]}],
             "generationConfig": {"temperature": 0.7, "maxOutputTokens": 1024}
         }
         params = {"key": GEMINI_API_KEY}
-        response = requests.post(endpoint, headers=headers, params=params, json=data, timeout=30)
+        response = GEMINI_SESSION.post(GEMINI_ENDPOINT, params=params, json=data, timeout=30)
         response.raise_for_status()
         result = response.json()
         # Extract the generated text from Gemini's response
         return result['candidates'][0]['content']['parts'][0]['text']
     except Exception as e:
         logging.error(f"Gemini API error: {e}")
-        return "[Error: Could not optimize resume with Gemini AI.]"
+        return GEMINI_ERROR_MESSAGE
@@ -0,0 +1,107 @@
+# lib/cache.py
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+
+try:
+    import orjson  # Much faster JSON encoding/decoding when available
+except ImportError:
+    orjson = None
+
+# Default on-disk location of the cache database (<project root>/cache/job_matcher.sqlite)
+CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'job_matcher.sqlite')
+
+
+def make_key(namespace, *parts):
+    """
+    Builds a cache key from a namespace and any number of key parts.
+
+    The parts are hashed so that long values (URLs, resume text) produce short, fixed-size keys.
+
+    Args:
+        namespace (str): Prefix identifying what is cached (e.g. 'search_jobs').
+        *parts: Values that identify the cached entry. Converted with str().
+
+    Returns:
+        str: The cache key.
+    """
+    digest = hashlib.sha256('\x1f'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+def _dumps(value):
+    """Encodes a value as a JSON string, with orjson if it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(value)
+
+
+def get_cache_connection(path=CACHE_PATH):
+    """Opens the SQLite cache database, creating the file and table if they don't exist."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")  # Allow concurrent readers while a thread writes
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS cache (
+            cache_key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,          -- JSON-encoded value
+            created_at REAL NOT NULL      -- Unix timestamp
+        )
+    """)
+    return conn
+
+
+def get_cached(key, max_age_seconds=None, path=CACHE_PATH):
+    """
+    Returns the cached value for a key.
+
+    Args:
+        key (str): The cache key (see make_key).
+        max_age_seconds (float, optional): Entries older than this are treated as missing.
+        path (str, optional): Path to the cache database.
+
+    Returns:
+        The cached value, or None if there is no fresh entry or the cache can't be read.
+    """
+    try:
+        conn = get_cache_connection(path)
+        try:
+            row = conn.execute("SELECT value, created_at FROM cache WHERE cache_key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error as err:
+        logging.error(f"Error reading from cache: {err}")
+        return None
+
+    if row is None:
+        return None
+    value, created_at = row
+    if max_age_seconds is not None and time.time() - created_at > max_age_seconds:
+        return None
+    return orjson.loads(value) if orjson is not None else json.loads(value)
+
+
+def set_cached(key, value, path=CACHE_PATH):
+    """
+    Stores a JSON-serialisable value in the cache, replacing any existing entry for the key.
+
+    Args:
+        key (str): The cache key (see make_key).
+        value: The value to store.
+        path (str, optional): Path to the cache database.
+    """
+    try:
+        conn = get_cache_connection(path)
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (cache_key, value, created_at) VALUES (?, ?, ?)",
+                    (key, _dumps(value), time.time())
+                )
+        finally:
+            conn.close()
+    except sqlite3.Error as err:
+        logging.error(f"Error writing to cache: {err}")
@@ -1,12 +1,39 @@
 import re
-import spacy
+import functools
+from bisect import bisect_right
+from itertools import islice
 from bs4 import BeautifulSoup
-from rake_nltk import Rake
 import logging
-
-# Configure logging (optional, but highly recommended)
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
+from lib.nlp import get_nlp, get_rake_stopwords, REGEX_SKILLS_PATTERN, ALL_CAPS_PATTERN
+
+# Headings that mark the main job description section. A tuple so that
+# str.startswith can test all of them in a single C-level call.
+PREFERRED_HEADINGS = ('job description', 'role overview', 'position summary', 'position overview')
+
+# Section heading patterns (expand as needed). The heading groups are compiled into a
+# single alternation so each line is checked with one regex scan instead of four.
+SECTION_HEADING_PATTERN = re.compile(
+    r'^\s*('
+    r'job\s+description|role\s+overview|about\s+the\s+role|position\s+summary|position\s+overview|what\s+you\s+will\s+do|your\s+role'
+    r'|responsibilities|duties|key\s+responsibilities'
+    r'|requirements|qualifications|skills\s+required|what\s+you\s+bring|what\s+we\'re\s+looking\s+for'
+    r'|summary|overview|purpose'
+    r')[\s:]*$',
+    re.I
+)
+
+# Search results often repeat the same snippet across keywords, so extraction results are memoized
+EXTRACTION_CACHE_SIZE = 8192
+
+# Common tech keywords (top-level for easy modification)
+TECH_KEYWORDS = (
+    'python', 'aws', 'docker', 'kubernetes', 'sql', 'rest', 'agile', 'ci/cd', 'linux',
+    'terraform', 'prometheus', 'grafana', 'github actions', 'jenkins', 'infrastructure as code',
+    'java', 'javascript', 'typescript', 'django', 'maven', 'gradle', 'git', 'bitbucket', 'github',
+    'bash', 'ksh', 'spark', 'kafka', 'scikit-learn', 'vue.js'
+)
+
+@functools.lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
 def extract_job_description(job_text):
     """
     Extracts the main job description section from a full job posting (plain text or HTML).
@@ -20,7 +47,7 @@ def extract_job_description(job_text):
     """
     logging.info("Extracting job description")
 
-    if not job_text or not job_text.strip():
+    if not job_text or job_text.isspace():
         logging.warning("Empty job text provided.")
         return ""
 
@@ -37,48 +64,47 @@ def extract_job_description(job_text):
         else:
             logging.debug("Job text is plain text.")
 
-        # Section heading patterns (expand as needed) - More robust regex!
-        section_patterns = [
-            r'(?i)^\s*(job\s+description|role\s+overview|about\s+the\s+role|position\s+summary|position\s+overview|what\s+you\s+will\s+do|your\s+role)[\s:]*$',
-            r'(?i)^\s*(responsibilities|duties|key\s+responsibilities)[\s:]*$',
-            r'(?i)^\s*(requirements|qualifications|skills\s+required|what\s+you\s+bring|what\s+we\'re\s+looking\s+for)[\s:]*$',
-            r'(?i)^\s*(summary|overview|purpose)[\s:]*$',
-        ]
-
         # Split into lines and find section indices - Stripped lines for pattern matching
         lines = [line.strip() for line in job_text.splitlines()]
-        section_indices = [(i, line.lower()) for i, line in enumerate(lines)
-                           if any(re.match(pat, line) for pat in section_patterns)]
+        # Heading line numbers and lowercased headings are kept in parallel lists; the line
+        # numbers are ascending, so the next section can be found with a binary search
+        section_starts = []
+        section_headings = []
+        for i, line in enumerate(lines):
+            if SECTION_HEADING_PATTERN.match(line):
+                section_starts.append(i)
+                section_headings.append(line.lower())
 
         # Heuristic: prefer the first 'job description' or 'role overview' section, else first section found
         main_section_start = 0
         main_section_end = len(lines)
 
-        preferred_headings = ['job description', 'role overview', 'position summary', 'position overview']
-
-        for idx, heading in section_indices:
-            if any(pref_heading in heading for pref_heading in preferred_headings):
+        for idx, heading in zip(section_starts, section_headings):
+            # Headings are whole stripped lines, so the preferred phrase can only appear at the start
+            if heading.startswith(PREFERRED_HEADINGS):
                 main_section_start = idx + 1
-                next_sections = [i for i, _ in section_indices if i > idx]
-                main_section_end = next_sections[0] if next_sections else len(lines)
+                next_pos = bisect_right(section_starts, idx)
+                main_section_end = section_starts[next_pos] if next_pos < len(section_starts) else len(lines)
                 break  # Important to break the loop
         else:  # Executes if the 'for' loop completes without a 'break'
-            if section_indices:
-                main_section_start = section_indices[0][0] + 1
-                next_sections = [i for i, _ in section_indices if i > main_section_start]
-                main_section_end = next_sections[0] if next_sections else len(lines)
+            if section_starts:
+                main_section_start = section_starts[0] + 1
+                next_pos = bisect_right(section_starts, main_section_start)
+                main_section_end = section_starts[next_pos] if next_pos < len(section_starts) else len(lines)
 
         # Extract the description and strip each line (cleaner)
         desc_lines = [line for line in lines[main_section_start:main_section_end] if line] # Skip empty lines
         desc = '\n'.join(desc_lines).strip()
 
-        # If still too short, fallback to first 10 sentences
-        if len(desc.split()) < 30:
+        # If still too short, fallback to first 10 sentences. Splitting stops after 30 words,
+        # which is enough to decide, so long descriptions are not tokenised in full.
+        if len(desc.split(None, 30)) < 30:
             logging.info("Description is too short. Using fallback sentence segmentation.")
             try:
-                nlp = spacy.load('en_core_web_sm')
+                nlp = get_nlp()
                 doc = nlp(job_text)
-                sentences = [sent.text.strip() for sent in doc.sents][:10] # Strip whitespace
+                # Only the first 10 sentences are used, so stop iterating after them
+                sentences = [sent.text.strip() for sent in islice(doc.sents, 10)] # Strip whitespace
                 desc = ' '.join(sentences)
             except Exception as e:
                 logging.error(f"Error during sentence segmentation fallback: {e}")
@@ -103,58 +129,56 @@ def extract_job_requirements(job_text):
     Returns:
         list: A sorted list of keywords/phrases.
     """
+    # The memoized result is an immutable tuple; hand each caller its own list
+    return list(_extract_job_requirements(job_text))
+
+
+@functools.lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def _extract_job_requirements(job_text):
+    """Memoized implementation of extract_job_requirements, returning a tuple."""
     logging.info("Extracting job requirements")
 
-    if not job_text or not job_text.strip():
+    if not job_text or job_text.isspace():
         logging.warning("Empty job text provided.")
-        return []
+        return ()
 
     try:
-        # Rake-Nltk extraction
-        rake = Rake(min_length=2, max_length=3)
+        # Rake-Nltk extraction (imported lazily, only this function needs it)
+        from rake_nltk import Rake
+        rake = Rake(stopwords=get_rake_stopwords(), min_length=2, max_length=3)
         rake.extract_keywords_from_text(job_text)
         ranked_phrases = set(rake.get_ranked_phrases()[:10])
 
-        # Regex for versioned skills and common tech (case-insensitive, word boundaries)
-        regex_skills = set(re.findall(r'\b(Python\s+[23](?:\.\d+)?|SQL|AWS|Java\s*\d+|C\+\+|C#|TypeScript|JavaScript|Docker|Kubernetes|Terraform|Prometheus|Grafana|Jenkins|Linux|REST)\b', job_text, re.I))
+        regex_skills = set(REGEX_SKILLS_PATTERN.findall(job_text))
 
         # spaCy for verbs, nouns, and NER
-        nlp = spacy.load('en_core_web_sm')
+        nlp = get_nlp()
         doc = nlp(job_text)
-        verbs = {token.lemma_ for token in doc if token.pos_ == 'VERB'}
-        nouns = {token.lemma_ for token in doc if token.pos_ == 'NOUN'}
+        # Verbs and nouns end up in the same keyword set, so collect both in one pass over the tokens
+        verbs_and_nouns = {token.lemma_ for token in doc if token.pos_ in ('VERB', 'NOUN')}
         entities = {ent.text for ent in doc.ents if ent.label_ in ['ORG', 'PRODUCT', 'SKILL', 'LANGUAGE']}
 
-        # All-caps words (common for tech skills)
-        all_caps = set(re.findall(r'\b[A-Z]{2,}\b', job_text))
-
-        # Common tech keywords (moved to top-level for easy modification)
-        tech_keywords = [
-            'python', 'aws', 'docker', 'kubernetes', 'sql', 'rest', 'agile', 'ci/cd', 'linux',
-            'terraform', 'prometheus', 'grafana', 'github actions', 'jenkins', 'infrastructure as code',
-            'java', 'javascript', 'typescript', 'django', 'maven', 'gradle', 'git', 'bitbucket', 'github',
-            'bash', 'ksh', 'spark', 'kafka', 'scikit-learn', 'vue.js'
-        ]
+        all_caps = set(ALL_CAPS_PATTERN.findall(job_text))
 
         text_lower = job_text.lower()
-        tech_found = {kw for kw in tech_keywords if kw in text_lower}
+        tech_found = {kw for kw in TECH_KEYWORDS if kw in text_lower}
 
         # Combine all sources
         keywords = set()
         keywords.update(ranked_phrases)
         keywords.update(regex_skills)
-        keywords.update(verbs)
-        keywords.update(nouns)
+        keywords.update(verbs_and_nouns)
         keywords.update(entities)
         keywords.update(all_caps)
         keywords.update(tech_found)
 
-        # Clean up: remove empty, deduplicate, and sort
-        keywords = {kw.strip() for kw in keywords if kw and isinstance(kw, str) and kw.strip()} #Robust checks
+        # Clean up: strip each keyword once, drop empty/non-string entries, and sort
+        keywords = {kw.strip() for kw in keywords if isinstance(kw, str)}
+        keywords.discard('')
 
         logging.info("Job requirements extraction successful.")
-        return sorted(keywords, key=lambda x: x.lower())
+        return tuple(sorted(keywords, key=str.lower))
 
     except Exception as e:
         logging.exception(f"Unexpected error during job requirements extraction: {e}")
-        return []
\ No newline at end of file
+        return ()
\ No newline at end of file
@@ -69,12 +69,15 @@ def adjust_resume(resume_text, job_keywords, ai_api_key=None):
     if not missing_skills:
         return "Your resume already covers all key job requirements!"
 
-    suggestions = "The following job requirements are missing from your resume:\n"
-    suggestions += ", ".join(missing_skills) + "\n\n"
-    suggestions += "Consider adding the following lines to your resume (tailor them to your specific experience):\n"
-
+    # Collect the lines in a list and join once instead of growing a string with +=
+    lines = [
+        "The following job requirements are missing from your resume:",
+        ", ".join(missing_skills),
+        "",
+        "Consider adding the following lines to your resume (tailor them to your specific experience):",
+    ]
     for skill in missing_skills:
-        suggestions += f"- Demonstrated proficiency in {skill} through [relevant project/experience].\n"
-        suggestions += f"- Utilized {skill} to achieve [specific outcome] in [relevant role].\n"
+        lines.append(f"- Demonstrated proficiency in {skill} through [relevant project/experience].")
+        lines.append(f"- Utilized {skill} to achieve [specific outcome] in [relevant role].")
 
-    return suggestions
\ No newline at end of file
+    return "\n".join(lines) + "\n"
\ No newline at end of file
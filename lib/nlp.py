@@ -0,0 +1,74 @@
+# lib/nlp.py
+import re
+import functools
+import threading
+
+# Versioned skills and common tech, shared by the job and resume parsers (case-insensitive)
+_TECH_SKILLS = r'Python\s+[23](?:\.\d+)?|SQL|AWS|Java\s*\d+|C\+\+|C#|TypeScript|JavaScript|Docker|Kubernetes|Terraform|Prometheus|Grafana|Jenkins|Linux|REST'
+REGEX_SKILLS_PATTERN = re.compile(r'\b(' + _TECH_SKILLS + r')\b', re.I)
+# Resume extraction has always matched without word boundaries (e.g. the 'SQL' in 'MySQL')
+RESUME_REGEX_SKILLS_PATTERN = re.compile(_TECH_SKILLS, re.I)
+
+# All-caps words (common for tech skills)
+ALL_CAPS_PATTERN = re.compile(r'\b[A-Z]{2,}\b')
+
+
+# The loaders are first called from several worker threads at once. lru_cache does not stop
+# concurrent first calls from each loading (and NLTK's lazy corpus loader is not thread-safe),
+# so first use is serialized.
+_LOAD_LOCK = threading.Lock()
+
+
+def get_nlp():
+    """
+    Loads the spaCy English model on first use and returns the cached pipeline.
+
+    spaCy is imported here rather than at module level so that code paths which never
+    need it do not pay its import and model-load cost. Safe to call from several threads.
+
+    Returns:
+        spacy.language.Language: The loaded 'en_core_web_sm' pipeline.
+    """
+    with _LOAD_LOCK:
+        return _load_nlp()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_nlp():
+    import spacy
+    return spacy.load('en_core_web_sm')
+
+
+def get_rake_stopwords():
+    """
+    Returns the NLTK English stopwords used by Rake, read from disk once.
+
+    Rake() reads the NLTK stopword list on every construction unless stopwords are passed in,
+    and a new Rake is built for every job and resume. Safe to call from several threads.
+
+    Returns:
+        frozenset: The English stopwords.
+    """
+    with _LOAD_LOCK:
+        return _load_rake_stopwords()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_rake_stopwords():
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words('english'))
+
+
+@functools.lru_cache(maxsize=1)
+def get_spacy_stopwords():
+    """
+    Returns spaCy's English stopwords, importing spaCy on first use.
+
+    The stopword list needs no model, but importing it still imports the whole spacy
+    package, so it is deferred like the model itself.
+
+    Returns:
+        frozenset: The English stopwords.
+    """
+    from spacy.lang.en.stop_words import STOP_WORDS
+    return frozenset(STOP_WORDS)
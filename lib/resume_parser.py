@@ -1,6 +1,8 @@
 import logging
-import spacy
+import functools
 from rake_nltk import Rake
+from lib.nlp import get_nlp, get_rake_stopwords, RESUME_REGEX_SKILLS_PATTERN, ALL_CAPS_PATTERN
+from lib.job_parser import TECH_KEYWORDS
 
 
 def extract_resume_text(resume_file):
@@ -9,12 +11,16 @@ def extract_resume_text(resume_file):
     Logs an error and returns an empty string if the file does not exist or is empty.
     """
     try:
-        with open(resume_file, 'r', encoding='utf-8') as f:
-            text = f.read()
-            if not text.strip():
-                logging.error(f"Resume file '{resume_file}' is empty.")
-                return ""
-            return text
+        # Read the raw bytes and decode once, skipping the text wrapper's newline translation
+        with open(resume_file, 'rb') as f:
+            text = f.read().decode('utf-8')
+        # Same result as text mode's universal newlines, only paid for files with carriage returns
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        if not text or text.isspace():
+            logging.error(f"Resume file '{resume_file}' is empty.")
+            return ""
+        return text
     except FileNotFoundError:
         logging.error(f"Resume file '{resume_file}' not found.")
     except Exception as e:
@@ -27,42 +33,42 @@ def extract_resume_skills(resume_text):
     Extracts skills/keywords from the resume text using Rake-nltk, spaCy, regex, and tech keyword matching.
     Returns a list of skills as strings.
     """
+    # The same resume is analysed for every job it is adjusted to, so the result is memoized
+    # as an immutable tuple and each caller gets its own list
+    return list(_extract_resume_skills(resume_text))
+
+
+@functools.lru_cache(maxsize=8)
+def _extract_resume_skills(resume_text):
+    """Memoized implementation of extract_resume_skills, returning a tuple."""
     print("Extracting Skills")
-    if not resume_text or not resume_text.strip():
-        return []
+    if not resume_text or resume_text.isspace():
+        return ()
     # Rake-Nltk extraction
-    rake = Rake(min_length=2, max_length=3)
+    rake = Rake(stopwords=get_rake_stopwords(), min_length=2, max_length=3)
     rake.extract_keywords_from_text(resume_text)
     ranked_phrases = set(rake.get_ranked_phrases()[:15])
     # Regex for versioned skills and common tech
-    import re
-    regex_skills = set(re.findall(r'Python\s+[23](?:\.\d+)?|SQL|AWS|Java\s*\d+|C\+\+|C#|TypeScript|JavaScript|Docker|Kubernetes|Terraform|Prometheus|Grafana|Jenkins|Linux|REST', resume_text, re.I))
+    regex_skills = set(RESUME_REGEX_SKILLS_PATTERN.findall(resume_text))
     # spaCy for verbs, nouns, and NER
-    nlp = spacy.load('en_core_web_sm')
-    doc = nlp(resume_text)
-    verbs = {token.lemma_ for token in doc if token.pos_ == 'VERB'}
-    nouns = {token.lemma_ for token in doc if token.pos_ == 'NOUN'}
+    doc = get_nlp()(resume_text)
+    # Verbs and nouns end up in the same keyword set, so collect both in one pass over the tokens
+    verbs_and_nouns = {token.lemma_ for token in doc if token.pos_ in ('VERB', 'NOUN')}
     entities = {ent.text for ent in doc.ents if ent.label_ in ['ORG', 'PRODUCT', 'SKILL', 'LANGUAGE']}
     # All-caps words (common for tech skills)
-    all_caps = set(re.findall(r'\b[A-Z]{2,}\b', resume_text))
+    all_caps = set(ALL_CAPS_PATTERN.findall(resume_text))
     # Common tech keywords
-    tech_keywords = [
-        'python', 'aws', 'docker', 'kubernetes', 'sql', 'rest', 'agile', 'ci/cd', 'linux',
-        'terraform', 'prometheus', 'grafana', 'github actions', 'jenkins', 'infrastructure as code',
-        'java', 'javascript', 'typescript', 'django', 'maven', 'gradle', 'git', 'bitbucket', 'github',
-        'bash', 'ksh', 'spark', 'kafka', 'scikit-learn', 'vue.js'
-    ]
     text_lower = resume_text.lower()
-    tech_found = {kw for kw in tech_keywords if kw in text_lower}
+    tech_found = {kw for kw in TECH_KEYWORDS if kw in text_lower}
     # Combine all sources
     keywords = set()
     keywords.update(ranked_phrases)
     keywords.update(regex_skills)
-    keywords.update(verbs)
-    keywords.update(nouns)
+    keywords.update(verbs_and_nouns)
     keywords.update(entities)
     keywords.update(all_caps)
     keywords.update(tech_found)
-    # Clean up: remove empty, deduplicate, and sort
-    keywords = {kw.strip() for kw in keywords if kw.strip()}
-    return sorted(keywords, key=lambda x: x.lower())
+    # Clean up: strip each keyword once, drop empty entries, and sort
+    keywords = {kw.strip() for kw in keywords}
+    keywords.discard('')
+    return tuple(sorted(keywords, key=str.lower))
@@ -1,36 +1,304 @@
 # main.py
 import os
+import re
 import json  # Add JSON import
 import logging
-from lib import api_calls, scraper, resume_parser, job_parser, matcher, ats
+from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from lib import api_calls, resume_parser, job_parser, ats, cache
 # Comment out database imports for now
 # from lib.database import get_db_connection, create_results_table, save_job_result
-from config import API_KEY, CSE_ID
+
+try:
+    import orjson  # Much faster JSON serialization when available
+except ImportError:
+    orjson = None
 
 MAX_JOB_AGE_HOURS = 24  # Change this value to set the max age of job postings (in hours)
+MAX_WORKERS = 8  # Number of search terms processed concurrently
+MAX_OPTIMIZATION_WORKERS = 16  # Number of Gemini optimization calls in flight at once
+SEARCH_CACHE_HOURS = 6  # Reuse cached search results younger than this (in hours); 0 disables the cache
+ANALYSIS_CACHE_HOURS = 24 * 7  # Reuse cached job analyses (parsing + scores) younger than this (in hours); 0 disables it
+OPTIMIZATION_CACHE_HOURS = 24 * 7  # Reuse cached Gemini suggestions younger than this (in hours); 0 disables it
+RESUME_SKILLS_CACHE_HOURS = 24 * 7  # Reuse cached resume skills younger than this (in hours); 0 disables it
+# Part of the analysis and resume-skills cache keys, since the cached scores and skills depend on the
+# parsing and scoring code as well as on the inputs. Bump after changing that code so old entries are not reused.
+ANALYSIS_VERSION = 1
+
+# Characters that are not safe in result filenames, and the space -> underscore table
+_SANITIZE_RE = re.compile(r'[^\w\s-]')
+_SPACE_TBL = str.maketrans({' ': '_'})
+
+# Paths are resolved once, relative to this file
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BASE_DIR, 'results')
+SEARCH_TERMS_FILE = os.path.join(BASE_DIR, 'data', 'search_terms.txt')
+RESUME_FILE = os.path.join(BASE_DIR, 'data', 'resume.txt')
+
+# LinkedIn job postings are identified by the numeric id at the end of /jobs/view/<slug-><id>.
+# Anchored at the end of the path, so digits inside a slug (e.g. 'python-3-developer') are not taken for the id.
+_LINKEDIN_JOB_RE = re.compile(r'/jobs/view/(?:[^/]*-)?(\d+)/?$')
+# Query parameters that only track where a click came from and never identify a posting
+_TRACKING_PARAMS = frozenset({'trk', 'trackingid', 'refid', 'ref', 'gclid', 'fbclid', 'src'})
+
+# One search term per line: skips lines starting with '#' and blank lines, strips surrounding whitespace
+_SEARCH_TERM_RE = re.compile(r'^(?!#)[^\S\n]*(\S[^\n]*?)[^\S\n]*$', re.MULTILINE)
+
+# Matches 'Senior' as a whole word in a job title (but not e.g. 'Seniority')
+_SENIOR_RE = re.compile(r'\bsenior\b', re.IGNORECASE)
+
+logger = logging.getLogger(__name__)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+def _sanitize_filename(text, max_length=50):
+    """Strip characters that are unsafe in filenames and replace spaces with underscores."""
+    return _SANITIZE_RE.sub('', text or '').strip().translate(_SPACE_TBL)[:max_length]
+
+def _canonical_url(url):
+    """
+    Normalize a job URL so the same posting found through different searches compares equal.
+
+    LinkedIn postings are reduced to their job id. Other URLs lose tracking parameters,
+    the fragment and any trailing slash, and keep their remaining query parameters sorted.
+    """
+    parts = urlsplit(url)
+    netloc = parts.netloc.lower()
+    if 'linkedin.' in netloc:
+        match = _LINKEDIN_JOB_RE.search(parts.path)
+        if match:
+            return f"linkedin:{match.group(1)}"
+    query = urlencode(sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith('utm_') and name.lower() not in _TRACKING_PARAMS
+    ))
+    return urlunsplit((parts.scheme.lower(), netloc, parts.path.rstrip('/'), query, ''))
 
 # Function to save results to a JSON file
 def save_results_to_json(results, keyword):
     """Save job search results to a JSON file."""
     # Create results directory if it doesn't exist
-    results_dir = os.path.join(os.path.dirname(__file__), 'results')
-    os.makedirs(results_dir, exist_ok=True)
+    os.makedirs(RESULTS_DIR, exist_ok=True)
     
     # Create a filename based on the search keyword and current time
-    from datetime import datetime
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = os.path.join(results_dir, f"job_search_{keyword.replace(' ', '_')}_{timestamp}.json")
+    filename = os.path.join(RESULTS_DIR, f"job_search_{_sanitize_filename(keyword)}_{timestamp}.json")
     
-    # Write to JSON file
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2)
+    # Write to a temporary file and rename it into place, so an interrupted run
+    # never leaves a truncated results file behind
+    tmp_filename = filename + '.tmp'
+    if orjson is not None:
+        with open(tmp_filename, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        # json.dump issues many small writes; a 64 KiB buffer batches them into fewer syscalls
+        with open(tmp_filename, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            json.dump(results, f, indent=2)
+    os.replace(tmp_filename, filename)
     
-    logging.info(f"Saved results to {filename}")
+    logger.info("Saved results to %s", filename)
     return filename
 
+def load_search_terms(path):
+    """Load search terms from a file, one per line, skipping blank lines and # comments."""
+    # Read the raw bytes and decode once instead of decoding line by line through a text wrapper
+    try:
+        with open(path, 'rb') as f:
+            text = f.read().decode('utf-8')
+    except FileNotFoundError:
+        logger.error("Search terms file '%s' not found.", path)
+        return []
+    return _SEARCH_TERM_RE.findall(text)
+
+def search_jobs_cached(keyword):
+    """
+    Searches for jobs with the CSE API, reusing results cached on disk by a recent run.
+
+    Only non-empty results are cached, so failed or empty searches are retried next time.
+    """
+    if not SEARCH_CACHE_HOURS:
+        return api_calls.search_jobs(keyword, max_age_hours=MAX_JOB_AGE_HOURS)
+
+    key = cache.make_key('search_jobs', keyword, MAX_JOB_AGE_HOURS)
+    search_results = cache.get_cached(key, max_age_seconds=SEARCH_CACHE_HOURS * 3600)
+    if search_results is not None:
+        logger.info("Using cached search results for: %s", keyword)
+        return search_results
+
+    search_results = api_calls.search_jobs(keyword, max_age_hours=MAX_JOB_AGE_HOURS)
+    if search_results:
+        cache.set_cached(key, search_results)
+    return search_results
+
+def extract_resume_skills_cached(resume_text):
+    """
+    Extracts the resume's skills, reusing the skills cached on disk by a recent run for the same resume.
+
+    Keyed by the resume text itself and ANALYSIS_VERSION, so editing the resume invalidates the entry.
+    """
+    if not RESUME_SKILLS_CACHE_HOURS:
+        return resume_parser.extract_resume_skills(resume_text)
+
+    key = cache.make_key('resume_skills', ANALYSIS_VERSION, resume_text)
+    resume_skills = cache.get_cached(key, max_age_seconds=RESUME_SKILLS_CACHE_HOURS * 3600)
+    if resume_skills is not None:
+        logger.info("Using cached resume skills")
+        return resume_skills
+
+    resume_skills = resume_parser.extract_resume_skills(resume_text)
+    if resume_skills:
+        cache.set_cached(key, resume_skills)
+    return resume_skills
+
+def optimize_resume_cached(resume_text, job_description):
+    """
+    Gets Gemini resume suggestions, reusing the response cached by a recent run for the
+    same resume and job description.
+
+    Error responses are not cached, so they are retried next time.
+    """
+    if not OPTIMIZATION_CACHE_HOURS:
+        return api_calls.optimize_resume_with_gemini(resume_text, job_description)
+
+    # The model and the prompt are part of the key, so changing either doesn't serve old suggestions
+    key = cache.make_key('resume_optimization', api_calls.GEMINI_ENDPOINT, api_calls.OPTIMIZATION_PROMPT_PREFIX,
+                         resume_text, job_description)
+    optimization = cache.get_cached(key, max_age_seconds=OPTIMIZATION_CACHE_HOURS * 3600)
+    if optimization is not None:
+        logger.info("Using cached resume optimization")
+        return optimization
+
+    optimization = api_calls.optimize_resume_with_gemini(resume_text, job_description)
+    if optimization and optimization != api_calls.GEMINI_ERROR_MESSAGE:
+        cache.set_cached(key, optimization)
+    return optimization
+
+def process_keyword(keyword, resume_text, resume_skills, optimization_executor, seen_jobs):
+    """
+    Searches for jobs matching a keyword and scores each result against the resume.
+
+    Scoring runs inline; Gemini resume optimizations for high-potential matches are
+    submitted to optimization_executor so their network latency overlaps.
+    Each job is claimed in seen_jobs by canonical URL before it is parsed, so a job returned for
+    several search terms is parsed, scored and optimized once, and the other terms reuse its data.
+    Jobs analysed against the same resume by a recent run are loaded from the on-disk cache.
+
+    Args:
+        keyword (str): The search term.
+        resume_text (str): The full resume text.
+        resume_skills (frozenset): Normalized resume skills (see ats.normalize_skills).
+        optimization_executor (Executor): Executor that runs the Gemini optimization calls.
+        seen_jobs (dict): Futures of job data by canonical URL, shared by all search terms of the run.
+
+    Returns:
+        list: Job data dicts sorted by similarity score (highest first), or None if
+              the search returned no results.
+    """
+    logger.info("=== Searching for: %s ===", keyword) # Use logging
+    search_results = search_jobs_cached(keyword)
+    if not search_results:
+        logger.warning("No results found with CSE API, try Web Scraper") # Use logging
+        return None
+    scored_results = []
+    other_claims = []  # Claims of jobs another search term is processing
+    pending_optimizations = []
+    claim = None
+    try:
+        for result in search_results:
+            # --- Filter out 'Senior' roles --- START
+            job_title = result.get('title', '')
+            if _SENIOR_RE.search(job_title):
+                logger.info("Skipping Senior role: %s", job_title)
+                continue # Skip this job result
+            # --- Filter out 'Senior' roles --- END
+
+            # The same posting is often returned for several search terms. The first term to reach it
+            # claims it before parsing (setdefault is atomic); the others get its data from the claim.
+            job_url = result.get('link')
+            url_key = _canonical_url(job_url) if job_url else None
+            claim = None
+            if url_key:
+                claim = Future()
+                existing_claim = seen_jobs.setdefault(url_key, claim)
+                if existing_claim is not claim:
+                    logger.info("Reusing results for already processed job: %s", job_url)
+                    other_claims.append(existing_claim)
+                    continue
+
+            full_job_text = result.get('snippet', '')
+            analysis_key = cache.make_key('job_analysis', ANALYSIS_VERSION, resume_text, url_key, full_job_text)
+            analysis = None
+            if ANALYSIS_CACHE_HOURS:
+                analysis = cache.get_cached(analysis_key, max_age_seconds=ANALYSIS_CACHE_HOURS * 3600)
+            if analysis is None:
+                # Use robust extraction for job description
+                job_description = job_parser.extract_job_description(full_job_text)
+                job_requirements = job_parser.extract_job_requirements(job_description)
+                analysis = {
+                    'job_description': job_description,
+                    'job_requirements': job_requirements,
+                    # Use the consistent ATS calculation logic
+                    'similarity_score': ats.calculate_similarity_normalized(resume_skills, job_requirements),
+                }
+            similarity_score = analysis['similarity_score']
+            job_description = analysis['job_description']
+
+            # Prepare job data 
+            job_data = {
+                'title': result.get('title'),
+                'company': result.get('company'), 
+                'location': result.get('location'),
+                'url': result.get('link'),
+                'ats_score': analysis.get('ats_score'),
+                'similarity_score': similarity_score,
+                'job_description': job_description,
+                'job_requirements': analysis['job_requirements'],
+                'resume_optimization': None
+            }
+
+            # If the job is a good match, get resume optimization suggestions
+            future = None
+            if similarity_score > 70:  # Only optimize for promising matches
+                logger.info("High potential match found! Optimizing resume for: %s", job_title)
+                future = optimization_executor.submit(optimize_resume_cached, resume_text, job_description)
+                pending_optimizations.append((job_data, future, claim))
+
+            # The ATS score only needs the similarity score, so it is computed while Gemini runs
+            if job_data['ats_score'] is None:
+                analysis['ats_score'] = ats.simulate_ats_analysis(resume_text, job_description, similarity_score)
+                job_data['ats_score'] = analysis['ats_score']
+                # Cache the analysis as soon as it is complete. Failed or empty extractions are
+                # not cached, so they are retried next time (e.g. once the spaCy model is installed).
+                if ANALYSIS_CACHE_HOURS and job_description and analysis['job_requirements']:
+                    cache.set_cached(analysis_key, analysis)
+
+            # Other search terms only see the job once it is complete; a job waiting on Gemini
+            # is published when its suggestions arrive
+            if claim is not None and future is None:
+                claim.set_result(job_data)
+            # Add to results list instead of saving to database
+            scored_results.append(job_data)
+
+        # Collect the optimization suggestions once all results have been scored
+        for job_data, future, job_claim in pending_optimizations:
+            job_data['resume_optimization'] = future.result()
+            if job_claim is not None:
+                job_claim.set_result(job_data)
+    except BaseException as e:
+        # Don't leave other search terms waiting on jobs this one will never finish
+        for job_claim in [claim] + [job_claim for _, _, job_claim in pending_optimizations]:
+            if job_claim is not None and not job_claim.done():
+                job_claim.set_exception(e)
+        raise
+
+    # Jobs claimed by other search terms; those terms never wait on a claim before finishing their own
+    scored_results.extend(claim.result() for claim in other_claims)
+
+    # Sort results by similarity_score descending
+    scored_results.sort(key=itemgetter('similarity_score'), reverse=True)
+    return scored_results
+
 def main():
     # Comment out database connection
     # conn = None
@@ -43,79 +311,42 @@ def main():
         # create_results_table(conn)
 
         # Load search terms from file
-        search_terms_path = os.path.join('data', 'search_terms.txt')
-        with open(search_terms_path, 'r', encoding='utf-8') as f:
-            search_terms = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        search_terms = load_search_terms(SEARCH_TERMS_FILE)
 
-        resume_file = 'data/resume.txt'  # Preset resume path
-        resume_text = resume_parser.extract_resume_text(resume_file)
-        resume_skills = resume_parser.extract_resume_skills(resume_text)
+        resume_text = resume_parser.extract_resume_text(RESUME_FILE)
+        # Lowercase the resume skills once; they are compared against every job
+        resume_skills = ats.normalize_skills(extract_resume_skills_cached(resume_text))
 
         # Dictionary to store all results by keyword
         all_results = {}
+        # Claims (futures of job data) by canonical URL, so a job returned for several search terms is processed once
+        seen_jobs = {}
 
-        for keyword in search_terms:
-            logging.info(f"=== Searching for: {keyword} ===") # Use logging
-            search_results = api_calls.search_jobs(keyword, max_age_hours=MAX_JOB_AGE_HOURS)
-            if not search_results:
-                logging.warning("No results found with CSE API, try Web Scraper") # Use logging
-                continue
-            scored_results = []
-            for result in search_results:
-                # --- Filter out 'Senior' roles --- START
-                job_title = result.get('title', '')
-                if 'senior' in job_title.lower():
-                    logging.info(f"Skipping Senior role: {job_title}")
-                    continue # Skip this job result
-                # --- Filter out 'Senior' roles --- END
+        # Each search term is independent and dominated by network latency (CSE + Gemini),
+        # so terms are processed concurrently. map() keeps results in search term order.
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor, \
+                ThreadPoolExecutor(max_workers=MAX_OPTIMIZATION_WORKERS) as optimization_executor:
+            keyword_results = executor.map(
+                partial(process_keyword, resume_text=resume_text, resume_skills=resume_skills,
+                        optimization_executor=optimization_executor, seen_jobs=seen_jobs),
+                search_terms
+            )
+            for keyword, scored_results in zip(search_terms, keyword_results):
+                if scored_results is None:
+                    continue
 
-                # Use robust extraction for job description
-                full_job_text = result.get('snippet', '')
-                job_description = job_parser.extract_job_description(full_job_text)
-                job_requirements = job_parser.extract_job_requirements(job_description)
-                
-                # Use the consistent ATS calculation logic
-                similarity_score = ats.calculate_similarity_simple(resume_skills, job_requirements)
-                ats_score = ats.simulate_ats_analysis(resume_text, job_description, similarity_score)
-                
-                # If the job is a good match, get resume optimization suggestions
-                if similarity_score > 70:  # Only optimize for promising matches
-                    logging.info(f"High potential match found! Optimizing resume for: {job_title}")
-                    optimized_resume = api_calls.optimize_resume_with_gemini(resume_text, job_description)
-                    # Store optimization suggestions
-                    result['resume_optimization'] = optimized_resume
-                
-                # Prepare job data 
-                job_data = {
-                    'title': result.get('title'),
-                    'company': result.get('company'), 
-                    'location': result.get('location'),
-                    'url': result.get('link'),
-                    'ats_score': ats_score,
-                    'similarity_score': similarity_score,
-                    'job_description': job_description,
-                    'job_requirements': job_requirements,
-                    'resume_optimization': result.get('resume_optimization', None)
-                }
+                # Store results for this keyword
+                all_results[keyword] = scored_results
+
+                # Print results
+                for idx, result in enumerate(scored_results, 1):
+                    logger.info("\nResult %d:", idx) # Use logging
+                    logger.info("Title: %s", result['title'])
+                    logger.info("Link: %s", result['url'])
+                    logger.info("Extracted Keywords: %s", result['job_requirements'])
+                    logger.info("Similarity Score: %s%%", result['similarity_score'])
+                    logger.info("ATS Simulation Score: %s%%", result['ats_score'])
 
-                # Add to results list instead of saving to database
-                scored_results.append(job_data)
-
-            # Sort results by similarity_score descending
-            scored_results.sort(key=lambda x: x['similarity_score'], reverse=True)
-            
-            # Store results for this keyword
-            all_results[keyword] = scored_results
-            
-            # Print results
-            for idx, result in enumerate(scored_results, 1):
-                logging.info(f"\nResult {idx}:") # Use logging
-                logging.info(f"Title: {result['title']}")
-                logging.info(f"Link: {result['url']}")
-                logging.info(f"Extracted Keywords: {result['job_requirements']}")
-                logging.info(f"Similarity Score: {result['similarity_score']}%")
-                logging.info(f"ATS Simulation Score: {result['ats_score']}%")
-        
         # Save all results to JSON file
         if all_results:
             save_results_to_json(all_results, "all_searches")
@@ -128,4 +359,6 @@ def main():
         pass
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, so importing main has no side effects
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     main()
@@ -9,17 +9,13 @@ Usage:
 """
 
 import os
-import sys
 import json
 import logging
 import re
 from pathlib import Path
 from datetime import datetime
 
-# Add project root to path for imports
 TESTS_ROOT = Path(__file__).parent.parent
-PROJECT_ROOT = TESTS_ROOT.parent
-sys.path.append(str(PROJECT_ROOT))
 
 # Configure logging
 log_dir = TESTS_ROOT / "logs"
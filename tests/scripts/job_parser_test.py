@@ -22,7 +22,8 @@ from datetime import datetime
 # Add project root to path for imports
 TESTS_ROOT = Path(__file__).parent.parent
 PROJECT_ROOT = TESTS_ROOT.parent
-sys.path.append(str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:  # Already there when run through pytest
+    sys.path.append(str(PROJECT_ROOT))
 
 # Import job parser module
 from lib import job_parser
@@ -63,6 +63,16 @@ class TestATSFunctions(unittest.TestCase):
         # 3 out of 5 skills match (python, django) = 60%
         self.assertEqual(similarity, 60.0)
     
+    def test_similarity_with_normalized_skills(self):
+        """Test that pre-normalized resume skills give the same score"""
+        resume_skills = ["Python", "JavaScript", "SQL", "Django", "Flask"]
+        job_skills = ["python", "django", "postgresql", "react", "git"]
+        
+        normalized = ats.normalize_skills(resume_skills)
+        self.assertEqual(normalized, frozenset(["python", "javascript", "sql", "django", "flask"]))
+        self.assertEqual(ats.calculate_similarity_normalized(normalized, job_skills),
+                         ats.calculate_similarity_simple(resume_skills, job_skills))
+    
     def test_ats_analysis(self):
         """Test ATS analysis with resume and job text"""
         ats_score = ats.simulate_ats_analysis(self.sample_resume, self.sample_job)
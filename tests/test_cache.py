@@ -0,0 +1,40 @@
+import os
+import shutil
+import tempfile
+import unittest
+from lib import cache
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.temp_dir, 'cache', 'test.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        """Test that a stored value is returned unchanged"""
+        key = cache.make_key('search_jobs', 'python developer', 24)
+        value = [{'title': 'Software Engineer', 'link': 'http://example.com/job1', 'snippet': 'Python'}]
+        cache.set_cached(key, value, path=self.cache_path)
+        self.assertEqual(cache.get_cached(key, path=self.cache_path), value)
+
+    def test_missing_key(self):
+        """Test that an unknown key returns None"""
+        key = cache.make_key('search_jobs', 'unknown')
+        self.assertIsNone(cache.get_cached(key, path=self.cache_path))
+
+    def test_expired_entry(self):
+        """Test that entries older than max_age_seconds are ignored"""
+        key = cache.make_key('search_jobs', 'python developer')
+        cache.set_cached(key, ['result'], path=self.cache_path)
+        self.assertIsNone(cache.get_cached(key, max_age_seconds=-1, path=self.cache_path))
+        self.assertEqual(cache.get_cached(key, max_age_seconds=60, path=self.cache_path), ['result'])
+
+    def test_make_key_distinguishes_parts(self):
+        """Test that different key parts produce different keys"""
+        self.assertNotEqual(cache.make_key('search_jobs', 'a b', 24), cache.make_key('search_jobs', 'a', 'b', 24))
+        self.assertNotEqual(cache.make_key('search_jobs', 'a'), cache.make_key('analysis', 'a'))
+
+if __name__ == '__main__':
+    unittest.main()
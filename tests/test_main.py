@@ -0,0 +1,56 @@
+import os
+import shutil
+import tempfile
+import unittest
+import main
+
+class TestCanonicalUrl(unittest.TestCase):
+    def test_strips_tracking_parameters(self):
+        """Test that tracking parameters, fragments and trailing slashes are dropped"""
+        url = 'https://Example.com/jobs/123/?utm_source=google&b=2&trk=feed&a=1#apply'
+        self.assertEqual(main._canonical_url(url), 'https://example.com/jobs/123?a=1&b=2')
+
+    def test_same_posting_with_different_tracking(self):
+        """Test that two links to one posting canonicalize to the same key"""
+        first = 'https://example.com/careers/42?utm_campaign=spring&id=7'
+        second = 'https://example.com/careers/42/?id=7&utm_medium=email'
+        self.assertEqual(main._canonical_url(first), main._canonical_url(second))
+
+    def test_linkedin_slug_and_id(self):
+        """Test that LinkedIn postings are keyed by their numeric id"""
+        with_slug = 'https://www.linkedin.com/jobs/view/python-developer-at-acme-3912345678/?refId=abc&trk=public_jobs'
+        bare_id = 'https://ca.linkedin.com/jobs/view/3912345678'
+        self.assertEqual(main._canonical_url(with_slug), 'linkedin:3912345678')
+        self.assertEqual(main._canonical_url(bare_id), 'linkedin:3912345678')
+
+    def test_linkedin_digits_inside_slug_are_not_an_id(self):
+        """Test that a slug containing digits is not collapsed to a LinkedIn id"""
+        url = 'https://www.linkedin.com/jobs/view/python-3-developer'
+        self.assertEqual(main._canonical_url(url), url)
+
+class TestLoadSearchTerms(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'search_terms.txt')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_skips_comments_and_blank_lines(self):
+        """Test that comment and blank lines are ignored and whitespace is trimmed"""
+        with open(self.path, 'wb') as f:
+            f.write(b'# search terms\r\n  python developer  \r\n\r\n   \r\n#data engineer\r\nml engineer\r\n')
+        self.assertEqual(main.load_search_terms(self.path), ['python developer', 'ml engineer'])
+
+    def test_last_line_without_newline(self):
+        """Test that a final line without a trailing newline is read"""
+        with open(self.path, 'wb') as f:
+            f.write(b'python developer\ndevops engineer')
+        self.assertEqual(main.load_search_terms(self.path), ['python developer', 'devops engineer'])
+
+    def test_missing_file(self):
+        """Test that a missing file returns an empty list"""
+        self.assertEqual(main.load_search_terms(os.path.join(self.temp_dir, 'missing.txt')), [])
+
+if __name__ == '__main__':
+    unittest.main()